@@ -616,8 +616,8 @@ def check_kickstart(ks, opts):
 
     if opts.make_fsimage or (opts.make_pxe_live and opts.no_virt):
         # Make sure the kickstart isn't using autopart and only has a / mountpoint
-        part_ok = not any(p for p in ks.handler.partition.partitions
-                             if p.mountpoint not in ["/", "swap"])
+        part_ok = not any(p.mountpoint not in ["/", "swap"]
+                          for p in ks.handler.partition.partitions)
         if not part_ok or ks.handler.autopart.seen:
             errors.append("Filesystem images must use a single / part, not autopart or "
                           "multiple partitions. swap is allowed but not used.")
@@ -17,12 +17,33 @@ import logging
 log = logging.getLogger("pylorax")
 
 import dnf
+from functools import lru_cache
 import os
 import shutil
 
 from pylorax import DEFAULT_PLATFORM_ID, DEFAULT_RELEASEVER
 from pylorax.sysutils import flatconfig
 
+# URL schemes that dnf can fetch from
+SUPPORTED_REPO_SCHEMES = ('http://', 'https://', 'ftp://', 'file://')
+
+@lru_cache(maxsize=1)
+def get_platform_id():
+    """ Return the module platform id of the host
+
+        :returns: PLATFORM_ID from /etc/os-release or DEFAULT_PLATFORM_ID
+        :rtype: str
+
+        /etc/os-release does not change while lorax is running, so it is
+        only read the first time this is called.
+    """
+    if not os.path.exists("/etc/os-release"):
+        log.warning("/etc/os-release is missing, cannot determine platform id, falling back to %s", DEFAULT_PLATFORM_ID)
+        return DEFAULT_PLATFORM_ID
+
+    os_release = flatconfig("/etc/os-release")
+    return os_release.get("PLATFORM_ID", DEFAULT_PLATFORM_ID)
+
 def get_dnf_base_object(installroot, sources, mirrorlists=None, repos=None,
                         enablerepos=None, disablerepos=None,
                         tempdir="/var/tmp", proxy=None, releasever=DEFAULT_RELEASEVER,
@@ -47,7 +68,7 @@ def get_dnf_base_object(installroot, sources, mirrorlists=None, repos=None,
         """Convert bare paths to file:/// URIs, and silently reject protocols unhandled by yum"""
         if repo.startswith("/"):
             return "file://{0}".format(repo)
-        elif any(repo.startswith(p) for p in ('http://', 'https://', 'ftp://', 'file://')):
+        elif repo.startswith(SUPPORTED_REPO_SCHEMES):
             return repo
         else:
             return None
@@ -106,12 +127,7 @@ def get_dnf_base_object(installroot, sources, mirrorlists=None, repos=None,
         conf.sslverify = False
 
     # DNF 3.2 needs to have module_platform_id set, otherwise depsolve won't work correctly
-    if not os.path.exists("/etc/os-release"):
-        log.warning("/etc/os-release is missing, cannot determine platform id, falling back to %s", DEFAULT_PLATFORM_ID)
-        platform_id = DEFAULT_PLATFORM_ID
-    else:
-        os_release = flatconfig("/etc/os-release")
-        platform_id = os_release.get("PLATFORM_ID", DEFAULT_PLATFORM_ID)
+    platform_id = get_platform_id()
     log.info("Using %s for module_platform_id", platform_id)
     conf.module_platform_id = platform_id
 
@@ -23,7 +23,6 @@ import select
 import subprocess
 from subprocess import TimeoutExpired
 import signal
-import time
 
 import logging
 log = logging.getLogger("pylorax")
@@ -307,11 +306,15 @@ def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_st
         def __next__(self):
             # Return lines from stdout while also calling _callback
             while True:
-                # Check for input without blocking
-                if select.select([self._proc.stdout], [], [], 0)[0]:
+                # Wait up to 0.5s for input, unless there is already a line to return
+                timeout = 0 if "\n" in self._data else 0.5
+                eof = False
+                if select.select([self._proc.stdout], [], [], timeout)[0]:
                     size = len(self._proc.stdout.peek(1))
                     if size > 0:
                         self._data += self._proc.stdout.read(size).decode("utf-8")
+                    else:
+                        eof = True
 
                 if self._data.find("\n") >= 0:
                     line = self._data.split("\n", 1)
@@ -340,8 +343,13 @@ def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_st
                                 (self._argv, self._proc.returncode))
                     raise StopIteration
 
-                # Don't loop too fast with no input to read
-                time.sleep(0.5)
+                # select returns immediately once stdout is closed, wait for the
+                # process to exit instead of looping too fast
+                if eof:
+                    try:
+                        self._proc.wait(timeout=0.5)
+                    except TimeoutExpired:
+                        pass
 
     argv = [command] + argv
 
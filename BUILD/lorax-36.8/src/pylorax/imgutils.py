@@ -34,6 +34,9 @@ from pylorax.sysutils import cpfile
 from pylorax.executils import execWithRedirect, execWithCapture
 from pylorax.executils import runcmd, runcmd_output
 
+# Filename suffix used for each compression type
+COMPRESSION_SUFFIXES = {"xz": ".xz", "gzip": ".gz", "bzip2": ".bz2", "lzma": ".lzma"}
+
 ######## Functions for making container images (cpio, tar, squashfs) ##########
 
 def compress(command, root, outfile, compression="xz", compressargs=None):
@@ -597,5 +600,4 @@ def default_image_name(compression, basename):
 
     If the compression is unknown it defaults to xz
     """
-    SUFFIXES = {"xz": ".xz", "gzip": ".gz", "bzip2": ".bz2", "lzma": ".lzma"}
-    return basename + SUFFIXES.get(compression, ".xz")
+    return basename + COMPRESSION_SUFFIXES.get(compression, ".xz")
@@ -170,7 +170,8 @@ class QEMUInstall(object):
         :param str ovmf_path: Path to the OVMF firmware
         """
         # Lookup qemu-system- for arch if passed, or try to guess using host arch
-        qemu_cmd = [self.QEMU_CMDS.get(arch or os.uname().machine, "qemu-system-"+os.uname().machine)]
+        host_arch = os.uname().machine
+        qemu_cmd = [self.QEMU_CMDS.get(arch or host_arch, "qemu-system-"+host_arch)]
         if not os.path.exists("/usr/bin/"+qemu_cmd[0]):
             raise InstallError("%s does not exist, cannot run qemu" % qemu_cmd[0])
 
@@ -321,13 +322,17 @@ def anaconda_cleanup(dirinstall_path):
     # and then remove the pid file.
     if os.path.exists("/var/run/anaconda.pid"):
         # anaconda may be started using unshare so the pid is always 1
-        if open("/var/run/anaconda.pid").read().strip() == "1":
+        with open("/var/run/anaconda.pid") as f:
+            pid = f.read().strip()
+        if pid == "1":
             os.unlink("/var/run/anaconda.pid")
 
     rc = True
     dirinstall_path = os.path.abspath(dirinstall_path)
     # unmount filesystems
-    for mounted in reversed(open("/proc/mounts").readlines()):
+    with open("/proc/mounts") as f:
+        mounts = f.readlines()
+    for mounted in reversed(mounts):
         (_device, mountpoint, _rest) = mounted.split(" ", 2)
         if mountpoint.startswith(dirinstall_path) and os.path.ismount(mountpoint):
             try:
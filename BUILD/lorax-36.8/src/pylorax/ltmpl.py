@@ -47,10 +47,11 @@ class LoraxTemplate(object):
         # we have to add ["/"] to the template lookup directories or the
         # file includes won't work properly for absolute paths
         self.directories = ["/"] + directories
+        # Reuse one lookup so templates included by several runs are only compiled once
+        self.lookup = TemplateLookup(directories=self.directories)
 
     def parse(self, template_file, variables):
-        lookup = TemplateLookup(directories=self.directories)
-        template = lookup.get_template(template_file)
+        template = self.lookup.get_template(template_file)
 
         try:
             textbuf = template.render(**variables)
@@ -59,13 +60,9 @@ class LoraxTemplate(object):
             logger.error(text_error_template().render())
             raise
 
-        # split, strip and remove empty lines
-        lines = textbuf.splitlines()
-        lines = [line.strip() for line in lines]
-        lines = [line for line in lines if line]
-
-        # remove comments
-        lines = [line for line in lines if not line.startswith("#")]
+        # split, strip and remove empty lines and comments in a single pass
+        lines = (line.strip() for line in textbuf.splitlines())
+        lines = (line for line in lines if line and not line.startswith("#"))
 
         # split with shlex and perform brace expansion. This can fail, so we unroll the loop
         # for better error reporting.
@@ -137,6 +134,7 @@ class TemplateRunner(object):
         self.templatefile = None
         self.builtins = builtins or {}
         self.defaults = defaults or {}
+        self._template = None
 
 
     def run(self, templatefile, **variables):
@@ -144,8 +142,9 @@ class TemplateRunner(object):
             variables.setdefault(k,v)
         logger.debug("executing %s with variables=%s", templatefile, variables)
         self.templatefile = templatefile
-        t = LoraxTemplate(directories=[self.templatedir])
-        commands = t.parse(templatefile, variables)
+        if self._template is None:
+            self._template = LoraxTemplate(directories=[self.templatedir])
+        commands = self._template.parse(templatefile, variables)
         self._run(commands)
 
 
@@ -199,7 +198,7 @@ class InstallpkgMixin:
           "grub2<2.06"
         """
         # Always return the highest of the filtered results
-        if not any(g for g in ['=', '<', '>', '!'] if g in pkg_spec):
+        if not any(g in pkg_spec for g in ['=', '<', '>', '!']):
             query = dnf.subject.Subject(pkg_spec).get_best_query(self.dbo.sack)
         else:
             pcv = re.split(r'([!<>=]+)', pkg_spec)
@@ -307,7 +306,7 @@ class InstallpkgMixin:
                 pkgnvrs = sorted(["{}-{}-{}".format(pkg.name, pkg.version, pkg.release) for pkg in pkgnames])
 
                 # If the request is a glob, expand it in the log
-                if any(g for g in ['*','?','.'] if g in p):
+                if any(g in p for g in ['*','?','.']):
                     logger.info("installpkg: %s expands to %s", p, ",".join(pkgnvrs))
 
                 for pkgnvr in pkgnvrs:
@@ -386,7 +385,8 @@ class LoraxTemplateRunner(TemplateRunner, InstallpkgMixin):
         return set(f for pkg in pkglist for f in pkg.files if not os.path.isdir(self._out(f)))
 
     def _getsize(self, *files):
-        return sum(os.path.getsize(self._out(f)) for f in files if os.path.isfile(self._out(f)))
+        paths = (self._out(f) for f in files)
+        return sum(os.path.getsize(p) for p in paths if os.path.isfile(p))
 
     def _write_package_log(self):
         """
@@ -840,10 +840,9 @@ class LoraxTemplateRunner(TemplateRunner, InstallpkgMixin):
           Examples:
             createaddrsize ${INITRD_ADDRESS} ${outroot}/${BOOTDIR}/initrd.img ${outroot}/${BOOTDIR}/initrd.addrsize
         '''
-        addrsize = open(dest, "wb")
         addrsize_data = struct.pack(">iiii", 0, int(addr, 16), 0, os.stat(src).st_size)
-        addrsize.write(addrsize_data)
-        addrsize.close()
+        with open(dest, "wb") as addrsize:
+            addrsize.write(addrsize_data)
 
     def systemctl(self, cmd, *units):
         '''
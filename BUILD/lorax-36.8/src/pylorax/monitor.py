@@ -51,8 +51,8 @@ class LogRequestHandler(socketserver.BaseRequestHandler):
     ]
 
     re_tests = [
-        r"packaging: base repo .* not valid",
-        r"packaging: .* requires .*"
+        re.compile(r"packaging: base repo .* not valid"),
+        re.compile(r"packaging: .* requires .*")
     ]
 
     def setup(self):
@@ -117,13 +117,13 @@ class LogRequestHandler(socketserver.BaseRequestHandler):
 
         for t in self.simple_tests:
             if t in line:
-                self.server.log_error = True
                 self.server.error_line = line
+                self.server.log_error = True
                 return
         for t in self.re_tests:
             if re.search(t, line):
-                self.server.log_error = True
                 self.server.error_line = line
+                self.server.log_error = True
                 return
 
 
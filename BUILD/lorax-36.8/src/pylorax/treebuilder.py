@@ -50,7 +50,8 @@ def generate_module_info(moddir, outfile=None):
         output = runcmd_output(["modinfo", "-F", "description", mod])
         return output.strip()
     def read_module_set(name):
-        return set(l.strip() for l in open(joinpaths(moddir,name)) if ".ko" in l)
+        with open(joinpaths(moddir,name)) as f:
+            return set(l.strip() for l in f if ".ko" in l)
     modsets = {'scsi':read_module_set("modules.block"),
                'eth':read_module_set("modules.networking")}
 
@@ -62,10 +63,11 @@ def generate_module_info(moddir, outfile=None):
                 desc = module_desc(joinpaths(root,mod)) or "%s driver" % name
                 modinfo.append(dict(name=name, type=modtype, desc=desc))
 
-    out = open(outfile or joinpaths(moddir,"module-info"), "w")
-    out.write("Version 0\n")
+    lines = ["Version 0\n"]
     for mod in sorted(modinfo, key=lambda m: m.get('name')):
-        out.write('{name}\n\t{type}\n\t"{desc:.65}"\n'.format(**mod))
+        lines.append('{name}\n\t{type}\n\t"{desc:.65}"\n'.format(**mod))
+    with open(outfile or joinpaths(moddir,"module-info"), "w") as out:
+        out.write("".join(lines))
 
 class RuntimeBuilder(object):
     '''Builds the anaconda runtime image.'''
@@ -154,8 +156,7 @@ class RuntimeBuilder(object):
         q = self.dbo.sack.query()
         for pkgobj in q.installed():
             with open(joinpaths(pkglistdir, pkgobj.name), "w") as fobj:
-                for fname in pkgobj.files:
-                    fobj.write("{0}\n".format(fname))
+                fobj.write("".join("{0}\n".format(fname) for fname in pkgobj.files))
 
     def postinstall(self):
         '''Do some post-install setup work with runtime-postinstall.tmpl'''
@@ -222,12 +223,14 @@ class RuntimeBuilder(object):
 
     def writepkgsizes(self, pkgsizefile):
         '''debugging data: write a big list of pkg sizes'''
-        fobj = open(pkgsizefile, "w")
         getsize = lambda f: os.lstat(f).st_size if os.path.exists(f) else 0
         q = self.dbo.sack.query()
+        lines = []
         for p in sorted(q.installed()):
             pkgsize = sum(getsize(joinpaths(self.vars.root,f)) for f in p.files)
-            fobj.write("{0.name}.{0.arch}: {1}\n".format(p, pkgsize))
+            lines.append("{0.name}.{0.arch}: {1}\n".format(p, pkgsize))
+        with open(pkgsizefile, "w") as fobj:
+            fobj.write("".join(lines))
 
     def generate_module_data(self):
         root = self.vars.root
@@ -315,11 +318,13 @@ class TreeBuilder(object):
         if not backup:
             args.append("--force")
 
-        if not self.kernels:
+        # Scan the boot directory once, the property re-reads it on every access
+        kernels = self.kernels
+        if not kernels:
             raise Exception("No kernels found, cannot rebuild_initrds")
 
         with DracutChroot(self.vars.inroot) as dracut:
-            for kernel in self.kernels:
+            for kernel in kernels:
                 if prefix:
                     idir = os.path.dirname(kernel.path)
                     outfile = joinpaths(idir, prefix+'-'+kernel.version+'.img')
@@ -386,15 +391,16 @@ class TreeBuilder(object):
 
 #### TreeBuilder helper functions
 
+# To find possible flavors, awk '/BuildKernel/ { print $4 }' kernel.spec
+kernel_flavors = ('debug', 'PAE', 'PAEdebug', 'smp', 'xen', 'lpae')
+kernel_re = re.compile(r"vmlinuz-(?P<version>.+?\.(?P<arch>[a-z0-9_]+)"
+                       r"(.(?P<flavor>{0}))?)$".format("|".join(kernel_flavors)))
+
 def findkernels(root="/", kdir="boot"):
-    # To find possible flavors, awk '/BuildKernel/ { print $4 }' kernel.spec
-    flavors = ('debug', 'PAE', 'PAEdebug', 'smp', 'xen', 'lpae')
-    kre = re.compile(r"vmlinuz-(?P<version>.+?\.(?P<arch>[a-z0-9_]+)"
-                     r"(.(?P<flavor>{0}))?)$".format("|".join(flavors)))
     kernels = []
     bootfiles = os.listdir(joinpaths(root, kdir))
     for f in bootfiles:
-        match = kre.match(f)
+        match = kernel_re.match(f)
         if match:
             kernel = DataHolder(path=joinpaths(kdir, f))
             kernel.update(match.groupdict()) # sets version, arch, flavor
@@ -414,13 +420,10 @@ def findkernels(root="/", kdir="boot"):
     return kernels
 
 # udev whitelist: 'a-zA-Z0-9#+.:=@_-' (see is_whitelisted in libudev-util.c)
-udev_blacklist=' !"$%&\'()*,/;<>?[\\]^`{|}~' # ASCII printable, minus whitelist
-udev_blacklist += ''.join(chr(i) for i in range(32)) # ASCII non-printable
+udev_blacklist = frozenset(' !"$%&\'()*,/;<>?[\\]^`{|}~'     # ASCII printable, minus whitelist
+                           + ''.join(chr(i) for i in range(32))) # ASCII non-printable
 def udev_escape(label):
-    out = ''
-    for ch in label:
-        out += ch if ch not in udev_blacklist else '\\x%02x' % ord(ch)
-    return out
+    return ''.join(ch if ch not in udev_blacklist else '\\x%02x' % ord(ch) for ch in label)
 
 def string_lower(string):
     """ Return a lowercase string.
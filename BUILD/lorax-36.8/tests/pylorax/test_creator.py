@@ -43,6 +43,14 @@ def mkFakeBoot(root_dir):
         f.write("I AM A FAKE INITRD")
 
 
+def parse_ks(ks_str):
+    """Parse a kickstart string and return the KickstartParser"""
+    ks_version = makeVersion()
+    ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
+    ks.readKickstartFromString(ks_str)
+    return ks
+
+
 class CreatorTest(unittest.TestCase):
     def test_fakednf(self):
         """Test FakeDNF class"""
@@ -101,8 +109,6 @@ class CreatorTest(unittest.TestCase):
                               ["eth0", "eth1"], ram=4096, vcpus=8, arch="x86_64",
                               title="Lorax Test", project="Fedora", releasever="30")
 
-                with open(output_xml.name) as f:
-                    print(f.read())
                 # Parse the XML and check for known fields
                 tree = ET.parse(output_xml.name)
                 image = tree.getroot()
@@ -140,10 +146,9 @@ class CreatorTest(unittest.TestCase):
             create_pxe_config(template, work_dir, live_image_name, add_pxe_args)
             with open(joinpaths(work_dir, "PXE_CONFIG")) as f:
                 pxe_config = f.read()
-            print(pxe_config)
-            self.assertTrue("vmlinuz-4.18.13-200.fc28.x86_64" in pxe_config)
-            self.assertTrue("initramfs-4.18.13-200.fc28.x86_64.img" in pxe_config)
-            self.assertTrue("/live-rootfs.squashfs.img ostree=/mnt/sysimage/" in pxe_config)
+            self.assertIn("vmlinuz-4.18.13-200.fc28.x86_64", pxe_config)
+            self.assertIn("initramfs-4.18.13-200.fc28.x86_64.img", pxe_config)
+            self.assertIn("/live-rootfs.squashfs.img ostree=/mnt/sysimage/", pxe_config)
 
     def test_make_runtime_squashfs(self):
         """Test making a runtime squashfs only image"""
@@ -160,12 +165,12 @@ class CreatorTest(unittest.TestCase):
 
                 # Make sure it looks like a squashfs filesystem
                 file_details = get_file_magic(joinpaths(work_dir, "images/install.img"))
-                self.assertTrue("Squashfs" in file_details)
+                self.assertIn("Squashfs", file_details)
 
                 # Make sure the fake kernel is in there
                 cmd = ["unsquashfs", "-n", "-l", joinpaths(work_dir, "images/install.img")]
                 results = runcmd_output(cmd)
-                self.assertTrue("vmlinuz-" in results)
+                self.assertIn("vmlinuz-", results)
 
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
@@ -184,12 +189,12 @@ class CreatorTest(unittest.TestCase):
 
                 # Make sure it looks like a squashfs filesystem
                 file_details = get_file_magic(joinpaths(work_dir, "images/install.img"))
-                self.assertTrue("Squashfs" in file_details)
+                self.assertIn("Squashfs", file_details)
 
                 # Make sure there is a rootfs.img inside the squashfs
                 cmd = ["unsquashfs", "-n", "-l", joinpaths(work_dir, "images/install.img")]
                 results = runcmd_output(cmd)
-                self.assertTrue("rootfs.img" in results)
+                self.assertIn("rootfs.img", results)
 
     def test_get_arch(self):
         """Test getting the arch of the installed kernel"""
@@ -197,7 +202,7 @@ class CreatorTest(unittest.TestCase):
             # Make a fake kernel and initrd
             mkFakeBoot(work_dir)
             arch = get_arch(work_dir)
-            self.assertTrue(arch == "x86_64")
+            self.assertEqual(arch, "x86_64")
 
     def test_find_ostree_root(self):
         with tempfile.TemporaryDirectory(prefix="lorax.test.") as work_dir:
@@ -208,179 +213,151 @@ class CreatorTest(unittest.TestCase):
     def test_good_ks_novirt(self):
         """Test a good kickstart with novirt"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n")
         self.assertEqual(check_kickstart(ks, opts), [])
 
     def test_good_ks_virt(self):
         """Test a good kickstart with virt"""
         opts = DataHolder(no_virt=False, make_fsimage=False, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n")
         self.assertEqual(check_kickstart(ks, opts), [])
 
     def test_nomethod_novirt(self):
         """Test a kickstart with repo and no url"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n")
+        ks = parse_ks("network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n")
         errors = check_kickstart(ks, opts)
-        self.assertTrue("Only url, nfs and ostreesetup" in errors[0])
-        self.assertTrue("repo can only be used with the url" in errors[1])
+        self.assertIn("Only url, nfs and ostreesetup", errors[0])
+        self.assertIn("repo can only be used with the url", errors[1])
 
     def test_no_network(self):
         """Test a kickstart with missing network command"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n")
         errors = check_kickstart(ks, opts)
-        self.assertTrue("The kickstart must activate networking" in errors[0])
+        self.assertIn("The kickstart must activate networking", errors[0])
 
     def test_displaymode(self):
         """Test a kickstart with displaymode set"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n"
-                                   "graphical\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n"
+                      "graphical\n")
         errors = check_kickstart(ks, opts)
-        self.assertTrue("must not set a display mode" in errors[0])
+        self.assertIn("must not set a display mode", errors[0])
 
     def test_autopart(self):
         """Test a kickstart with autopart"""
         opts = DataHolder(no_virt=True, make_fsimage=True, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "autopart\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "autopart\n"
+                      "shutdown\n")
         errors = check_kickstart(ks, opts)
-        self.assertTrue("Filesystem images must use a single" in errors[0])
+        self.assertIn("Filesystem images must use a single", errors[0])
 
     def test_boot_part(self):
         """Test a kickstart with a boot partition"""
         opts = DataHolder(no_virt=True, make_fsimage=True, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "part /boot --size=1024\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "part /boot --size=1024\n"
+                      "shutdown\n")
         errors = check_kickstart(ks, opts)
-        self.assertTrue("Filesystem images must use a single" in errors[0])
+        self.assertIn("Filesystem images must use a single", errors[0])
 
     def test_shutdown_virt(self):
         """Test a kickstart with reboot instead of shutdown"""
         opts = DataHolder(no_virt=False, make_fsimage=True, make_pxe_live=False)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "reboot\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "reboot\n")
         errors = check_kickstart(ks, opts)
-        self.assertTrue("must include shutdown when using virt" in errors[0])
+        self.assertIn("must include shutdown when using virt", errors[0])
 
     def test_disk_size_simple(self):
         """Test calculating the disk size with a simple / partition"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_iso=False, make_pxe_live=False, image_size_align=0)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n")
         self.assertEqual(calculate_disk_size(opts, ks), 4098)
 
     def test_disk_size_boot(self):
         """Test calculating the disk size with / and /boot partitions"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_iso=False, make_pxe_live=False, image_size_align=0)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "part /boot --size=512\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "part /boot --size=512\n"
+                      "shutdown\n")
         self.assertEqual(calculate_disk_size(opts, ks), 4610)
 
     def test_disk_size_boot_fsimage(self):
         """Test calculating the disk size with / and /boot partitions on a fsimage"""
         opts = DataHolder(no_virt=True, make_fsimage=True, make_iso=False, make_pxe_live=False, image_size_align=0)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "part /boot --size=512\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "part /boot --size=512\n"
+                      "shutdown\n")
         self.assertEqual(calculate_disk_size(opts, ks), 4098)
 
     def test_disk_size_reqpart(self):
         """Test calculating the disk size with reqpart and a / partition"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_iso=False, make_pxe_live=False, image_size_align=0)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "reqpart\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "reqpart\n"
+                      "shutdown\n")
         self.assertEqual(calculate_disk_size(opts, ks), 4598)
 
     def test_disk_size_reqpart_boot(self):
         """Test calculating the disk size with reqpart --add-boot and a / partition"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_iso=False, make_pxe_live=False, image_size_align=0)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "reqpart --add-boot\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "reqpart --add-boot\n"
+                      "shutdown\n")
         self.assertEqual(calculate_disk_size(opts, ks), 5622)
 
     def test_disk_size_align(self):
         """Test aligning the disk size"""
         opts = DataHolder(no_virt=True, make_fsimage=False, make_iso=False, make_pxe_live=False, image_size_align=1024)
-        ks_version = makeVersion()
-        ks = KickstartParser(ks_version, errorsAreFatal=False, missingIncludeIsFatal=False)
-        ks.readKickstartFromString("url --url=http://dl.fedoraproject.com\n"
-                                   "network --bootproto=dhcp --activate\n"
-                                   "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
-                                   "part / --size=4096\n"
-                                   "shutdown\n")
+        ks = parse_ks("url --url=http://dl.fedoraproject.com\n"
+                      "network --bootproto=dhcp --activate\n"
+                      "repo --name=other --baseurl=http://dl.fedoraproject.com\n"
+                      "part / --size=4096\n"
+                      "shutdown\n")
         self.assertEqual(calculate_disk_size(opts, ks), 5120)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
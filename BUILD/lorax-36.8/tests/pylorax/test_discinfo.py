@@ -25,6 +25,6 @@ class DiscInfoTest(unittest.TestCase):
             di = DiscInfo("1.0", "x86_64")
             di.write(f.name)
             f.seek(0)
-            self.assertTrue(f.readline().strip() not in ["", None])
+            self.assertNotIn(f.readline().strip(), ["", None])
             self.assertEqual(f.readline().strip(), "1.0")
             self.assertEqual(f.readline().strip(), "x86_64")
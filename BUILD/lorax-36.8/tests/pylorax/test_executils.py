@@ -17,6 +17,7 @@
 import os
 from subprocess import CalledProcessError
 import tempfile
+import time
 import unittest
 
 from pylorax.executils import startProgram
@@ -93,6 +94,22 @@ class ExecUtilsTest(unittest.TestCase):
         iterator = execReadlines(cmd[0], cmd[1:], callback=lambda p: True, filter_stderr=True)
         self.assertEqual(list(iterator), ["Truffula trees."])
 
+    def test_execReadlines_streaming(self):
+        """Test that lines are returned while the process is still running"""
+        # Delay the first line so a fixed sleep between reads would show up in the timing,
+        # and close stdout before exiting so the iterator has to wait for the process at EOF
+        cmd = ["sh", "-c", "sleep 0.2; echo one; sleep 1; printf two; exec >&-; sleep 1"]
+        start = time.monotonic()
+        iterator = execReadlines(cmd[0], cmd[1:], callback=lambda p: True, filter_stderr=True)
+        self.assertEqual(next(iterator), "one")
+        self.assertLess(time.monotonic() - start, 0.45)
+        self.assertIsNone(iterator._proc.poll())
+
+        # The final partial line is dropped and the iterator stops once the process exits
+        self.assertEqual(list(iterator), [])
+        self.assertEqual(iterator._proc.returncode, 0)
+        self.assertLess(time.monotonic() - start, 5)
+
     def test_execReadlines_error(self):
         with self.assertRaises(OSError):
             execReadlines("foo-prog", [])
@@ -130,7 +130,7 @@ class ImgUtilsTest(unittest.TestCase):
 
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("cpio" in file_details, file_details)
+                self.assertIn("cpio", file_details)
 
     def test_mktar(self):
         """Test mktar function"""
@@ -141,7 +141,7 @@ class ImgUtilsTest(unittest.TestCase):
 
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("POSIX tar" in file_details, file_details)
+                self.assertIn("POSIX tar", file_details)
 
     def test_compressed_mktar(self):
         """Test compressed mktar function"""
@@ -157,7 +157,7 @@ class ImgUtilsTest(unittest.TestCase):
 
                     self.assertTrue(os.path.exists(disk_img.name))
                     file_details = get_file_magic(disk_img.name)
-                    self.assertTrue(magic in file_details, (compression, magic, file_details))
+                    self.assertIn(magic, file_details, compression)
 
     def test_mktar_single_file(self):
         with tempfile.NamedTemporaryFile(prefix="lorax.test.disk.") as disk_img,\
@@ -180,7 +180,7 @@ class ImgUtilsTest(unittest.TestCase):
 
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("Squashfs" in file_details, file_details)
+                self.assertIn("Squashfs", file_details)
 
     def test_mksparse(self):
         """Test mksparse function"""
@@ -193,8 +193,8 @@ class ImgUtilsTest(unittest.TestCase):
         with tempfile.NamedTemporaryFile(prefix="lorax.test.disk.") as disk_img:
             mkqcow2(disk_img.name, 42 * 1024**2)
             file_details = get_file_magic(disk_img.name)
-            self.assertTrue("QEMU QCOW" in file_details, file_details)
-            self.assertTrue(str(42 * 1024**2) in file_details, file_details)
+            self.assertIn("QEMU QCOW", file_details)
+            self.assertIn(str(42 * 1024**2), file_details)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
     def test_loop(self):
@@ -203,7 +203,7 @@ class ImgUtilsTest(unittest.TestCase):
             mksparse(disk_img.name, 42 * 1024**2)
             loop_dev = loop_attach(disk_img.name)
             try:
-                self.assertTrue(loop_dev is not None)
+                self.assertIsNotNone(loop_dev)
                 self.assertEqual(loop_dev[5:], get_loop_name(disk_img.name))
             finally:
                 loop_detach(loop_dev)
@@ -214,7 +214,7 @@ class ImgUtilsTest(unittest.TestCase):
         with tempfile.NamedTemporaryFile(prefix="lorax.test.disk.") as disk_img:
             mksparse(disk_img.name, 42 * 1024**2)
             with LoopDev(disk_img.name) as loop_dev:
-                self.assertTrue(loop_dev is not None)
+                self.assertIsNotNone(loop_dev)
                 self.assertEqual(loop_dev[5:], get_loop_name(disk_img.name))
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
@@ -223,10 +223,10 @@ class ImgUtilsTest(unittest.TestCase):
         with tempfile.NamedTemporaryFile(prefix="lorax.test.disk.") as disk_img:
             mksparse(disk_img.name, 42 * 1024**2)
             with LoopDev(disk_img.name) as loop_dev:
-                self.assertTrue(loop_dev  is not None)
+                self.assertIsNotNone(loop_dev)
                 dm_name = dm_attach(loop_dev, 42 * 1024**2)
                 try:
-                    self.assertTrue(dm_name is not None)
+                    self.assertIsNotNone(dm_name)
                 finally:
                     dm_detach(dm_name)
 
@@ -236,9 +236,9 @@ class ImgUtilsTest(unittest.TestCase):
         with tempfile.NamedTemporaryFile(prefix="lorax.test.disk.") as disk_img:
             mksparse(disk_img.name, 42 * 1024**2)
             with LoopDev(disk_img.name) as loop_dev:
-                self.assertTrue(loop_dev  is not None)
+                self.assertIsNotNone(loop_dev)
                 with DMDev(loop_dev, 42 * 1024**2) as dm_name:
-                    self.assertTrue(dm_name is not None)
+                    self.assertIsNotNone(dm_name)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
     def test_mount(self):
@@ -247,9 +247,9 @@ class ImgUtilsTest(unittest.TestCase):
             mksparse(disk_img.name, 42 * 1024**2)
             runcmd(["mkfs.ext4", "-L", "Anaconda", "-b", "4096", "-m", "0", disk_img.name])
             with LoopDev(disk_img.name) as loopdev:
-                self.assertTrue(loopdev is not None)
+                self.assertIsNotNone(loopdev)
                 with Mount(loopdev) as mnt:
-                    self.assertTrue(mnt is not None)
+                    self.assertIsNotNone(mnt)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
     def test_mkdosimg(self):
@@ -260,7 +260,7 @@ class ImgUtilsTest(unittest.TestCase):
                 mkdosimg(work_dir, disk_img.name)
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("FAT " in file_details, file_details)
+                self.assertIn("FAT ", file_details)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
     def test_mkext4img(self):
@@ -272,7 +272,7 @@ class ImgUtilsTest(unittest.TestCase):
                 mkext4img(work_dir, disk_img.name, graft=graft)
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("ext2 filesystem" in file_details, file_details)
+                self.assertIn("ext2 filesystem", file_details)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
     def test_small_mkext4img(self):
@@ -299,7 +299,7 @@ class ImgUtilsTest(unittest.TestCase):
                 mkbtrfsimg(work_dir, disk_img.name)
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("BTRFS Filesystem" in file_details, file_details)
+                self.assertIn("BTRFS Filesystem", file_details)
 
     @unittest.skipUnless(os.geteuid() == 0 and not os.path.exists("/.in-container"), "requires root privileges, and no containers")
     def test_mkhfsimg(self):
@@ -310,7 +310,7 @@ class ImgUtilsTest(unittest.TestCase):
                 mkhfsimg(work_dir, disk_img.name, label="test")
                 self.assertTrue(os.path.exists(disk_img.name))
                 file_details = get_file_magic(disk_img.name)
-                self.assertTrue("Macintosh HFS" in file_details, file_details)
+                self.assertIn("Macintosh HFS", file_details)
 
     def test_default_image_name(self):
         """Test default_image_name function"""
@@ -325,13 +325,13 @@ class ImgUtilsTest(unittest.TestCase):
             self.assertTrue(mkfakediskimg(disk_img.name))
             # Make sure it can mount the / with /etc/passwd
             with PartitionMount(disk_img.name) as img_mount:
-                self.assertTrue(img_mount is not None)
+                self.assertIsNotNone(img_mount)
                 self.assertTrue(os.path.isdir(img_mount.mount_dir))
                 self.assertTrue(os.path.exists(joinpaths(img_mount.mount_dir, "/etc/passwd")))
 
             # Make sure submount works
             with PartitionMount(disk_img.name, submount="/a-sub-mount/") as img_mount:
-                self.assertTrue(img_mount is not None)
+                self.assertIsNotNone(img_mount)
                 self.assertTrue(os.path.isdir(img_mount.mount_dir))
                 self.assertTrue(os.path.exists(joinpaths(img_mount.mount_dir, "/etc/passwd")))
 
@@ -341,7 +341,7 @@ class ImgUtilsTest(unittest.TestCase):
                 return len(kernels) > 0
 
             with PartitionMount(disk_img.name, mount_ok=mount_ok) as img_mount:
-                self.assertTrue(img_mount is not None)
+                self.assertIsNotNone(img_mount)
                 self.assertTrue(os.path.isdir(img_mount.mount_dir))
                 self.assertFalse(os.path.exists(joinpaths(img_mount.mount_dir, "/etc/passwd")))
                 self.assertTrue(os.path.exists(joinpaths(img_mount.mount_dir, "vmlinuz-4.18.13-200.fc28.x86_64")))
@@ -356,4 +356,4 @@ class ImgUtilsTest(unittest.TestCase):
                 mkfsimage_from_disk(disk_img.name, fs_img.name)
                 self.assertTrue(os.path.exists(fs_img.name))
                 file_details = get_file_magic(fs_img.name)
-                self.assertTrue("ext2 filesystem" in file_details, file_details)
+                self.assertIn("ext2 filesystem", file_details)
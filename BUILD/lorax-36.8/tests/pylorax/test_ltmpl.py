@@ -14,9 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
-from contextlib import contextmanager
 import os
-from rpmfluff import SimpleRpmBuild, SourceFile, expectedArch
 import shutil
 import tempfile
 import unittest
@@ -26,6 +24,8 @@ from pylorax.ltmpl import LoraxTemplate, LoraxTemplateRunner
 from pylorax.ltmpl import brace_expand, split_and_expand, rglob, rexists
 from pylorax.sysutils import joinpaths
 
+from ..lib import createrepo, makeFakeRPM
+
 class TemplateFunctionsTestCase(unittest.TestCase):
     def test_brace_expand(self):
         """Test expanding braces"""
@@ -78,36 +78,6 @@ class LoraxTemplateTestCase(unittest.TestCase):
                                     ['installpkg', 'foo-one', 'foo-two'],
                                     ['run_pkg_transaction']])
 
-@contextmanager
-def in_tempdir(prefix='tmp'):
-    """Execute a block of code with chdir in a temporary location"""
-    oldcwd = os.getcwd()
-    tmpdir = tempfile.mkdtemp(prefix=prefix)
-    os.chdir(tmpdir)
-    try:
-        yield
-    finally:
-        os.chdir(oldcwd)
-        shutil.rmtree(tmpdir)
-
-def makeFakeRPM(repo_dir, name, epoch, version, release, files=None):
-    """Make a fake rpm file in repo_dir"""
-    p = SimpleRpmBuild(name, version, release)
-    if epoch:
-        p.epoch = epoch
-    if not files:
-        p.add_simple_payload_file_random()
-    else:
-        # Make a number of fake file entries in the rpm
-        for f in files:
-            p.add_installed_file(
-                installPath = f,
-                sourceFile = SourceFile(os.path.basename(f), "THIS IS A FAKE FILE"))
-    with in_tempdir("lorax-test-rpms."):
-        p.make()
-        rpmfile = p.get_built_rpm(expectedArch)
-        shutil.move(rpmfile, repo_dir)
-
 class LoraxTemplateRunnerTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(self):
@@ -125,7 +95,7 @@ class LoraxTemplateRunnerTestCase(unittest.TestCase):
                      "/lorax-files/file-two.txt",
                      "/lorax-files/file-three.txt"])
         makeFakeRPM(self.repo1_dir, "known-path", 0, "0.1.8", "1", ["/known-path/file-one.txt"])
-        os.system("createrepo_c " + self.repo1_dir)
+        createrepo(self.repo1_dir)
 
         self.repo2_dir = tempfile.mkdtemp(prefix="lorax.test.repo.")
         makeFakeRPM(self.repo2_dir, "fake-milhouse", 0, "1.0.0", "4", ["/fake-milhouse/1.0.0-4"])
@@ -133,12 +103,12 @@ class LoraxTemplateRunnerTestCase(unittest.TestCase):
         makeFakeRPM(self.repo2_dir, "fake-milhouse", 0, "1.3.0", "1", ["/fake-milhouse/1.3.0-1"])
         makeFakeRPM(self.repo2_dir, "fake-lisa", 0, "1.2.0", "1", ["/fake-lisa/1.2.0-1"])
         makeFakeRPM(self.repo2_dir, "fake-lisa", 0, "1.1.4", "5", ["/fake-lisa/1.1.4-5"])
-        os.system("createrepo_c " + self.repo2_dir)
+        createrepo(self.repo2_dir)
 
         self.repo3_dir = tempfile.mkdtemp(prefix="lorax.test.debug.repo.")
         makeFakeRPM(self.repo3_dir, "fake-marge", 0, "2.3.0", "1", ["/fake-marge/2.3.0-1"])
         makeFakeRPM(self.repo3_dir, "fake-marge-debuginfo", 0, "2.3.0", "1", ["/fake-marge/file-one-debuginfo.txt"])
-        os.system("createrepo_c " + self.repo3_dir)
+        createrepo(self.repo3_dir)
 
         # Get a dbo with just these repos
 
@@ -157,6 +127,7 @@ class LoraxTemplateRunnerTestCase(unittest.TestCase):
     def tearDownClass(self):
         shutil.rmtree(self.repo1_dir)
         shutil.rmtree(self.repo2_dir)
+        shutil.rmtree(self.repo3_dir)
         shutil.rmtree(self.root_dir)
 
     def test_pkgver_errors(self):
@@ -204,7 +175,6 @@ class LoraxTemplateRunnerTestCase(unittest.TestCase):
             else:
                 return "{}-{}-{}".format(pkg.name, pkg.version, pkg.release)
 
-        print([nevra(p) for p in list(self.dnfbase.sack.query().available())])
         for t in matrix:
             r = self.runner._pkgver(t[0])
             if t[1]:
@@ -4,6 +4,20 @@ import unittest
 
 from pylorax.monitor import LogMonitor
 
+def wait_for_error(monitor, timeout=10):
+    """Wait for the monitor to report an error, backing off between checks
+
+    Returns the final value of log_check()
+    """
+    delay = 0.01
+    end = time.time() + timeout
+    while time.time() < end:
+        if monitor.server.log_check():
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return monitor.server.log_check()
+
 class LogMonitorTest(unittest.TestCase):
     def test_monitor(self):
         monitor = LogMonitor(timeout=1)
@@ -14,8 +28,7 @@ class LogMonitorTest(unittest.TestCase):
                 time.sleep(1)
                 self.assertFalse(monitor.server.log_check())
                 s.sendall("\nAnother line\nTraceback (Not a real traceback)\n".encode("utf8"))
-                time.sleep(1)
-                self.assertTrue(monitor.server.log_check())
+                self.assertTrue(wait_for_error(monitor))
                 self.assertEqual(monitor.server.error_line, "Traceback (Not a real traceback)")
         finally:
             monitor.shutdown()
@@ -36,16 +49,15 @@ class LogMonitorTest(unittest.TestCase):
             monitor.shutdown()
 
     def test_monitor_timeout(self):
-        # Timeout is in minutes so to shorten the test we pass 0.1
-        monitor = LogMonitor(timeout=0.1)
+        # Timeout is in minutes so to shorten the test we pass 0.05 (3 seconds)
+        monitor = LogMonitor(timeout=0.05)
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.connect((monitor.host, monitor.port))
                 s.sendall("Just a test string\nwith two and a half\nlines in it".encode("utf8"))
                 time.sleep(1)
                 self.assertFalse(monitor.server.log_check())
-                time.sleep(7)
-                self.assertTrue(monitor.server.log_check())
+                self.assertTrue(wait_for_error(monitor))
                 self.assertEqual(monitor.server.error_line, "")
         finally:
             monitor.shutdown()
@@ -62,8 +74,7 @@ class LogMonitorTest(unittest.TestCase):
                 # Simulate a UTF8 character that gets broken into parts by buffering, etc.
                 data = "Just a test string\nTraceback (Not a real traceback)\nWith A"
                 s.sendall(data.encode("utf8") + b"\xc3")
-                time.sleep(1)
-                self.assertTrue(monitor.server.log_check())
+                self.assertTrue(wait_for_error(monitor))
                 self.assertEqual(monitor.server.error_line, "Traceback (Not a real traceback)")
         finally:
             monitor.shutdown()
@@ -14,51 +14,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
-from contextlib import contextmanager
 import os
-from rpmfluff import SimpleRpmBuild, SourceFile, expectedArch
-import shutil
 import tempfile
 import unittest
 
 from pylorax import ArchData, DataHolder
 from pylorax.dnfbase import get_dnf_base_object
-from pylorax.treebuilder import RuntimeBuilder
-
-# TODO Put these into a common test library location
-@contextmanager
-def in_tempdir(prefix='tmp'):
-    """Execute a block of code with chdir in a temporary location"""
-    oldcwd = os.getcwd()
-    tmpdir = tempfile.mkdtemp(prefix=prefix)
-    os.chdir(tmpdir)
-    try:
-        yield
-    finally:
-        os.chdir(oldcwd)
-        shutil.rmtree(tmpdir)
-
-def makeFakeRPM(repo_dir, name, epoch, version, release, files=None, provides=None):
-    """Make a fake rpm file in repo_dir"""
-    if provides is None:
-        provides = []
-    p = SimpleRpmBuild(name, version, release)
-    if epoch:
-        p.epoch = epoch
-    if not files:
-        p.add_simple_payload_file_random()
-    else:
-        # Make a number of fake file entries in the rpm
-        for f in files:
-            p.add_installed_file(
-                installPath = f,
-                sourceFile = SourceFile(os.path.basename(f), "THIS IS A FAKE FILE"))
-    for c in provides:
-        p.add_provides(c)
-    with in_tempdir("lorax-test-rpms."):
-        p.make()
-        rpmfile = p.get_built_rpm(expectedArch)
-        shutil.move(rpmfile, repo_dir)
+from pylorax.treebuilder import RuntimeBuilder, udev_escape
+
+from ..lib import createrepo, makeFakeRPM
 
 
 class InstallBrandingTestCase(unittest.TestCase):
@@ -66,7 +30,7 @@ class InstallBrandingTestCase(unittest.TestCase):
         """Run the get_branding function in a test repo"""
         with tempfile.TemporaryDirectory(prefix="lorax.test.") as root_dir:
             dbo = get_dnf_base_object(root_dir, ["file://"+repo_dir], enablerepos=[], disablerepos=[])
-            self.assertTrue(dbo is not None)
+            self.assertIsNotNone(dbo)
 
             product = DataHolder(name="Fedora", version="33", release="33",
                                  variant=variant, bugurl="http://none", isfinal=True)
@@ -79,22 +43,22 @@ class InstallBrandingTestCase(unittest.TestCase):
         # No system-release packages
         with tempfile.TemporaryDirectory(prefix="lorax.test.repo.") as repo_dir:
             makeFakeRPM(repo_dir, "fake-milhouse", 0, "1.0.0", "1")
-            os.system("createrepo_c " + repo_dir)
+            createrepo(repo_dir)
 
             branding = self.install_branding(repo_dir)
-            self.assertEqual(branding.release, None)
-            self.assertEqual(branding.logos, None)
+            self.assertIsNone(branding.release)
+            self.assertIsNone(branding.logos)
 
     def test_generic_pkg(self):
         """Test with a repo with only a generic-release package"""
         # Only generic-release
         with tempfile.TemporaryDirectory(prefix="lorax.test.repo.") as repo_dir:
             makeFakeRPM(repo_dir, "generic-release", 0, "33", "1", ["/etc/system-release"], ["system-release"])
-            os.system("createrepo_c " + repo_dir)
+            createrepo(repo_dir)
 
             branding = self.install_branding(repo_dir)
-            self.assertEqual(branding.release, None)
-            self.assertEqual(branding.logos, None)
+            self.assertIsNone(branding.release)
+            self.assertIsNone(branding.logos)
 
     def test_two_pkgs(self):
         """Test with a repo with generic-release, and a fedora-release package"""
@@ -103,7 +67,7 @@ class InstallBrandingTestCase(unittest.TestCase):
             makeFakeRPM(repo_dir, "generic-release", 0, "33", "1", ["/etc/system-release"], ["system-release"])
             makeFakeRPM(repo_dir, "fedora-release", 0, "33", "1", ["/etc/system-release"], ["system-release"])
             makeFakeRPM(repo_dir, "fedora-logos", 0, "33", "1")
-            os.system("createrepo_c " + repo_dir)
+            createrepo(repo_dir)
 
             branding = self.install_branding(repo_dir)
             self.assertEqual(branding.release, "fedora-release")
@@ -122,7 +86,7 @@ class InstallBrandingTestCase(unittest.TestCase):
             makeFakeRPM(repo_dir, "fedora-release", 0, "33", "1", ["/etc/system-release"], ["system-release"])
             makeFakeRPM(repo_dir, "fedora-logos", 0, "33", "1")
             makeFakeRPM(repo_dir, "fedora-release-workstation", 0, "33", "1", ["/etc/system-release"], ["system-release"])
-            os.system("createrepo_c " + repo_dir)
+            createrepo(repo_dir)
 
             branding = self.install_branding(repo_dir)
             self.assertEqual(branding.release, "fedora-release")
@@ -142,8 +106,19 @@ class InstallBrandingTestCase(unittest.TestCase):
         with tempfile.TemporaryDirectory(prefix="lorax.test.repo.") as repo_dir:
             makeFakeRPM(repo_dir, "fedora-release", 0, "33", "1", ["/etc/system-release"], ["system-release"])
             makeFakeRPM(repo_dir, "fedora-logos", 0, "33", "1")
-            os.system("createrepo_c " + repo_dir)
+            createrepo(repo_dir)
 
             branding = self.install_branding(repo_dir, skip_branding=True)
-            self.assertEqual(branding.release, None)
-            self.assertEqual(branding.logos, None)
+            self.assertIsNone(branding.release)
+            self.assertIsNone(branding.logos)
+
+
+class UdevEscapeTestCase(unittest.TestCase):
+    def test_whitelisted(self):
+        """Test that whitelisted characters are passed through"""
+        self.assertEqual(udev_escape("Fedora-36-x86_64.#+:=@_"), "Fedora-36-x86_64.#+:=@_")
+
+    def test_escaped(self):
+        """Test that blacklisted characters are hex escaped"""
+        self.assertEqual(udev_escape("Fedora 36/x86_64"), "Fedora\\x2036\\x2fx86_64")
+        self.assertEqual(udev_escape("tab\there"), "tab\\x09here")
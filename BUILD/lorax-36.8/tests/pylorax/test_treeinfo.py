@@ -38,7 +38,7 @@ class TreeInfoTest(unittest.TestCase):
             self.assertEqual(config.get("general", "variant"), "Server")
             self.assertEqual(config.get("general", "arch"), "x86_64")
             self.assertEqual(config.get("general", "packagedir"), "Packages")
-            self.assertTrue(config.get("general", "timestamp") not in ["", None])
+            self.assertNotIn(config.get("general", "timestamp"), ["", None])
 
             self.assertEqual(config.get("images", "initrd"), "images/pxeboot/initrd.img")
             self.assertEqual(config.get("images", "kernel"), "images/pxeboot/vmlinuz")